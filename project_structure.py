@@ -1,6 +1,99 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-def generate_ascii_tree(root_dir, output_file, exclude_dirs=None, exclude_files=None):
+# Tree connectors and child prefix extensions, indexed by whether the entry is last
+_CONN = ('├── ', '└── ')
+_EXT = ('│   ', '    ')
+
+# Common directories to exclude
+_COMMON_EXCLUSIONS = frozenset({
+    'node_modules',      # JavaScript dependencies
+    'venv',              # Python virtual environment
+    '__pycache__',       # Python bytecode cache
+    '.env',              # Environment variables
+    '.DS_Store',         # macOS metadata
+    'build',             # Build directories
+    'dist',              # Distribution directories
+    '*.egg-info',        # Python egg info
+    '.vscode',           # VS Code settings
+    '.idea',             # IntelliJ IDEA settings
+    '.pytest_cache',     # Pytest cache
+    'coverage',          # Coverage reports
+    'logs',              # Log directories
+    'temp',              # Temporary files
+})
+
+def parallel_walk(root_dir, jobs, onerror=None, max_ahead=None):
+    """
+    Walks a directory tree top-down like os.walk, listing directories on a thread pool.
+
+    The directories the walk will visit next are listed ahead of time, so the latency of
+    each scandir call overlaps with the others on network or cold-cache filesystems.
+    Results are yielded in the same order as os.walk, and pruning dirnames in place is
+    honored: pruned directories are never listed.
+
+    :param root_dir: The root directory to walk.
+    :param jobs: The number of worker threads.
+    :param onerror: A callable invoked with the OSError raised by a failed listing.
+    :param max_ahead: The most listings running at once (default: 16 per job).
+    """
+    if max_ahead is None:
+        max_ahead = jobs * 16
+    # Listings started ahead of the walk, keyed by path, and those still running
+    futures = {}
+    running = []
+
+    def scan(dir_path):
+        dir_names, file_names, links = [], [], set()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dir_names.append(entry.name)
+                    # Like os.walk, list symlinked directories but do not descend into them
+                    if entry.is_symlink():
+                        links.add(entry.name)
+                else:
+                    file_names.append(entry.name)
+        return dir_names, file_names, links
+
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        pending = [root_dir]
+        while pending:
+            # Start listing the directories the walk reaches next, nearest first
+            running = [f for f in running if not f.done()]
+            for path in reversed(pending[-max_ahead:]):
+                if len(running) >= max_ahead:
+                    break
+                if path not in futures:
+                    futures[path] = pool.submit(scan, path)
+                    running.append(futures[path])
+
+            dir_path = pending.pop()
+            future = futures.pop(dir_path, None) or pool.submit(scan, dir_path)
+            try:
+                dir_names, file_names, links = future.result()
+            except OSError as error:
+                if onerror is not None:
+                    onerror(error)
+                continue
+
+            yield dir_path, dir_names, file_names
+
+            # Push in reverse so the first subdirectory is visited next
+            for name in reversed(dir_names):
+                if name not in links:
+                    pending.append(os.path.join(dir_path, name))
+    finally:
+        for future in futures.values():
+            future.cancel()
+        pool.shutdown(wait=False)
+
+def generate_ascii_tree(root_dir, output_file, exclude_dirs=None, exclude_files=None, jobs=1, root_name=None):
     """
     Generates an ASCII tree representing the directory structure of the given root directory,
     excluding specified directories and files, while including .gitignore.
@@ -9,54 +102,92 @@ def generate_ascii_tree(root_dir, output_file, exclude_dirs=None, exclude_files=
     :param output_file: The path to the output text file.
     :param exclude_dirs: A set of directory names to exclude from the tree.
     :param exclude_files: A set of file names or patterns to exclude from the tree.
+    :param jobs: The number of threads listing directories in parallel (1 uses os.walk).
+    :param root_name: The name shown for the root directory (default: derived from root_dir).
     """
     if exclude_dirs is None:
-        exclude_dirs = set()
+        exclude_dirs = frozenset()
     if exclude_files is None:
-        exclude_files = set()
+        exclude_files = frozenset()
 
     try:
         with open(output_file, 'w', encoding='utf-8') as file:
-            def tree(dir_path, prefix=''):
-                # Get list of directories and files
-                try:
-                    entries = sorted(os.listdir(dir_path))
-                except PermissionError:
-                    # Indicate permission issues and skip the directory
-                    file.write(f"{prefix}└── [Permission Denied]\n")
-                    return
-
-                # Filter out excluded directories and hidden files/directories except .gitignore
-                filtered_entries = []
-                for entry in entries:
-                    # Include .gitignore even though it starts with '.'
-                    if entry.startswith('.') and entry != '.gitignore':
-                        continue
-                    # Skip excluded directories
-                    if os.path.isdir(os.path.join(dir_path, entry)) and entry in exclude_dirs:
-                        continue
-                    # Skip excluded files
-                    if os.path.isfile(os.path.join(dir_path, entry)) and entry in exclude_files:
-                        continue
-                    filtered_entries.append(entry)
-
-                entries_count = len(filtered_entries)
-                for index, entry in enumerate(filtered_entries):
-                    path = os.path.join(dir_path, entry)
-                    connector = '├── ' if index < entries_count - 1 else '└── '
-                    file.write(f"{prefix}{connector}{entry}\n")
-                    
-                    if os.path.isdir(path):
-                        extension = '│   ' if index < entries_count - 1 else '    '
-                        tree(path, prefix + extension)
+            # Collect output lines in memory and write them with a single call at the end
+            lines_out = []
+            append = lines_out.append
+
+            # Directories still being written, deepest last. Each frame holds the
+            # remaining (name, is_dir) entries in reverse order and the line prefix.
+            stack = []
+            # Depth of each directory the walk has yet to reach, keyed by the path it will yield
+            depths = {}
+
+            def emit(frame, stop_at=None):
+                # Write entries of a frame, pausing after the directory named stop_at
+                # and returning the prefix for that directory's children
+                entries, prefix = frame
+                while entries:
+                    name, is_dir = entries.pop()
+                    is_last = not entries
+                    append(f"{prefix}{_CONN[is_last]}{name}\n")
+
+                    if is_dir and name == stop_at:
+                        return prefix + _EXT[is_last]
+                return prefix
+
+            def enter(dir_path):
+                # os.walk is top-down, so every directory at this depth or deeper is done
+                depth = depths.pop(dir_path, 0)
+                while len(stack) > depth:
+                    emit(stack.pop())
+                if not stack:
+                    return ''
+                return emit(stack[-1], os.path.basename(dir_path))
+
+            def keep_dir(name):
+                # Skip hidden directories first (a cheap string test), then excluded ones
+                if name.startswith('.') and name != '.gitignore':
+                    return False
+                return name not in exclude_dirs
+
+            def on_error(error):
+                if not isinstance(error, PermissionError):
+                    raise error
+                # Indicate permission issues and skip the directory
+                prefix = enter(error.filename)
+                append(f"{prefix}{_CONN[True]}[Permission Denied]\n")
 
             # Write the root directory
-            root_name = os.path.basename(os.path.abspath(root_dir))
-            if root_name == '':
-                # This handles the case when root_dir is a root like '/'
-                root_name = root_dir
-            file.write(f"{root_name}/\n")
-            tree(root_dir)
+            if root_name is None:
+                # Falls back to root_dir itself when it is a root like '/'
+                root_name = os.path.basename(os.path.abspath(root_dir)) or root_dir
+            append(f"{root_name}/\n")
+
+            if jobs > 1:
+                walker = parallel_walk(root_dir, jobs, onerror=on_error)
+            else:
+                walker = os.walk(root_dir, topdown=True, onerror=on_error, followlinks=False)
+
+            for dir_path, dir_names, file_names in walker:
+                prefix = enter(dir_path)
+
+                # Prune excluded and hidden directories in place so the walk never descends into them
+                dir_names[:] = sorted(filter(keep_dir, dir_names))
+                for d in dir_names:
+                    depths[os.path.join(dir_path, d)] = len(stack) + 1
+                # Include .gitignore even though it starts with '.'
+                entries = [(d, True) for d in dir_names]
+                entries.extend(
+                    (f, False) for f in file_names
+                    if not (f.startswith('.') and f != '.gitignore') and f not in exclude_files
+                )
+                entries.sort(reverse=True)
+                stack.append((entries, prefix))
+
+            while stack:
+                emit(stack.pop())
+
+            file.write(''.join(lines_out))
 
         print(f"ASCII project structure has been written to '{output_file}'.")
     except IOError as e:
@@ -70,27 +201,30 @@ def manage_gitignore(root_dir, entries_to_ignore):
     :param entries_to_ignore: A list of file or directory names to ignore.
     """
     gitignore_path = os.path.join(root_dir, '.gitignore')
-    existing_entries = set()
 
-    # If .gitignore exists, read its current entries
-    if os.path.isfile(gitignore_path):
-        try:
-            with open(gitignore_path, 'r', encoding='utf-8') as gitignore_file:
-                existing_entries = set(line.strip() for line in gitignore_file if line.strip() and not line.startswith('#'))
-        except IOError as e:
-            print(f"Error reading '.gitignore': {e}")
-            return
+    content = ''
+
+    # If .gitignore exists, read its current entries; a missing file just means none yet
+    try:
+        with open(gitignore_path, 'r', encoding='utf-8') as gitignore_file:
+            content = gitignore_file.read()
+    except FileNotFoundError:
+        pass
+    except IOError as e:
+        print(f"Error reading '.gitignore': {e}")
+        return
+    existing_entries = set(line.strip() for line in content.splitlines() if line.strip() and not line.startswith('#'))
 
     # Determine which entries need to be added
     new_entries = set(entries_to_ignore) - existing_entries
 
     if new_entries:
+        lines = sorted(new_entries)
+        if content and not content.endswith('\n'):
+            lines.insert(0, '')  # Ensure there's a newline before appending
         try:
             with open(gitignore_path, 'a', encoding='utf-8') as gitignore_file:
-                if os.path.isfile(gitignore_path) and os.path.getsize(gitignore_path) > 0:
-                    gitignore_file.write('\n')  # Ensure there's a newline before appending
-                for entry in sorted(new_entries):
-                    gitignore_file.write(f"{entry}\n")
+                gitignore_file.write('\n'.join(lines) + '\n')
             print(f"Added {len(new_entries)} entries to '.gitignore'.")
         except IOError as e:
             print(f"Error writing to '.gitignore': {e}")
@@ -100,16 +234,24 @@ def manage_gitignore(root_dir, entries_to_ignore):
 def main():
     import argparse
 
+    def positive_int(value):
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+        return number
+
     # Set up command-line argument parsing
     parser = argparse.ArgumentParser(description='Analyze a project folder, create an ASCII tree text file, and manage .gitignore.')
     parser.add_argument('root_dir', nargs='?', default='.', help='The root directory of the project (default: current directory).')
     parser.add_argument('-o', '--output', default='project_structure.txt', help='The output text file (default: project_structure.txt).')
     parser.add_argument('-e', '--exclude', nargs='*', default=[], help='Additional directories to exclude from the ASCII tree and .gitignore.')
+    parser.add_argument('-j', '--jobs', type=positive_int, default=1, help='Number of threads listing directories in parallel, useful on network filesystems (default: 1).')
 
     args = parser.parse_args()
 
-    # Get absolute path of the root directory
+    # Get absolute path of the root directory once and derive its display name from it
     root_directory = os.path.abspath(args.root_dir)
+    root_display_name = os.path.basename(root_directory) or root_directory
     
     # Check if the root directory exists
     if not os.path.isdir(root_directory):
@@ -122,29 +264,11 @@ def main():
     if os.path.isfile(output_file):
         print(f"Existing '{args.output}' found and will be overwritten.")
 
-    # Define common directories to exclude
-    common_exclusions = {
-        'node_modules',      # JavaScript dependencies
-        'venv',              # Python virtual environment
-        '__pycache__',       # Python bytecode cache
-        '.env',              # Environment variables
-        '.DS_Store',         # macOS metadata
-        'build',             # Build directories
-        'dist',              # Distribution directories
-        '*.egg-info',        # Python egg info
-        '.vscode',           # VS Code settings
-        '.idea',             # IntelliJ IDEA settings
-        '.pytest_cache',     # Pytest cache
-        'coverage',          # Coverage reports
-        'logs',              # Log directories
-        'temp',              # Temporary files
-    }
-
     # Combine common exclusions with any additional exclusions provided by the user
-    exclusions = common_exclusions.union(set(args.exclude))
+    exclusions = _COMMON_EXCLUSIONS.union(args.exclude)
 
     # Generate the ASCII tree
-    generate_ascii_tree(root_directory, output_file, exclude_dirs=exclusions)
+    generate_ascii_tree(root_directory, output_file, exclude_dirs=exclusions, jobs=args.jobs, root_name=root_display_name)
 
     # Manage .gitignore
     # Include the script and output file, and all excluded directories
@@ -160,8 +284,8 @@ def main():
             if exclusion.endswith('/'):
                 entries_to_ignore.add(exclusion)
             else:
-                # Heuristic: if exclusion is in common_exclusions that are directories, append '/'
-                if exclusion in common_exclusions:
+                # Heuristic: if exclusion is in _COMMON_EXCLUSIONS that are directories, append '/'
+                if exclusion in _COMMON_EXCLUSIONS:
                     entries_to_ignore.add(exclusion + '/')
                 else:
                     entries_to_ignore.add(exclusion)